@@ -30,7 +30,23 @@ import discogssmells
 
 # grab the current year. Make sure to set the clock of your machine
 # to the correct date or use NTP!
-currentyear = datetime.datetime.utcnow().year
+CURRENT_YEAR = datetime.datetime.now(datetime.UTC).year
+
+whitespacere = re.compile(r'\s+')
+monthre = re.compile(r'-(\d+)-')
+pkdre = re.compile(r"\d{1,2}/((?:19|20)?\d{2})")
+manufacturingdatere = re.compile(r"(\d{2})\s+\d$")
+
+# translation tables to get rid of cruft in SPARS, ISRC and SID codes
+SPARS_TRANSLATE = str.maketrans({'.': None, ' ': None, '•': None, '·': None,
+                                 '[': None, ']': None, '-': None, '|': None,
+                                 '/': None})
+
+ISRC_TRANSLATE = str.maketrans({'-': None, ' ': None, '.': None,
+                                ':': None, '–': None})
+
+# some people insist on using ƒ instead of f
+SID_TRANSLATE = str.maketrans({' ': None, '-': None, 'ƒ': 'f'})
 
 # grab the latest release from the API. Results tend to get cached
 # by the Discogs nginx instance for some reason.
@@ -81,6 +97,32 @@ def checkrole(artist, release_id, credits):
     return invalidroles
 
 
+# convenience method to check a year found in an identifier
+# against the year of the release
+def checkyear(foundyear, year):
+    if not 1900 <= foundyear <= CURRENT_YEAR:
+        return 'impossible year'
+    if year < foundyear:
+        return 'release date earlier'
+    return None
+
+
+# convenience method to squash repeated whitespace into a single space.
+# Any whitespace other than a single space is not printable, so the
+# regular expression is only needed in that case.
+def squash_whitespace(text):
+    if '  ' in text or not text.isprintable():
+        return whitespacere.sub(' ', text)
+    return text
+
+
+# convenience method to search for variants of "depósito legal"
+def finddeposito(text):
+    if not discogssmells.depositores_literal in text:
+        return None
+    return discogssmells.depositores_any.search(text)
+
+
 # process the contents of a release
 def processrelease(release, config_settings, count, credits, ibuddy, favourites):
     releaseurl = 'https://www.discogs.com/release/%s'
@@ -99,6 +141,7 @@ def processrelease(release, config_settings, count, credits, ibuddy, favourites)
     founddeposito = False
     year = None
     release_id = release['id']
+    country = release.get('country', '')
 
     # check for favourite artist, if defined
     for artist in release['artists']:
@@ -111,49 +154,46 @@ def processrelease(release, config_settings, count, credits, ibuddy, favourites)
                 errormsgs.append('%8d -- Favourite Artist (%s): https://www.discogs.com/release/%s' % (count, artist['name'], str(release_id)))
 
     # check for misspellings of Czechoslovak and Czech releases
-    # People use 0x115 instead of 0x11B, which look very similar but 0x115
-    # is not valid in the Czech alphabet. Check for all data except
+    # (see discogssmells.czech_wrong_char). Check for all data except
     # the YouTube playlist.
-    # https://www.discogs.com/group/thread/757556
     # This is important for the following elements:
     # * tracklist (title, subtracks not supported yet)
     # * artist and extraartists (including extraartists in tracklist)
     # * notes
     # * BaOI identifiers (both value and description)
     if config_settings['check_spelling_cs']:
-        if 'country' in release:
-            if release['country'] == 'Czechoslovakia' or release['country'] == 'Czech Republic':
-                for t in release['tracklist']:
-                    if chr(0x115) in t['title']:
-                        count += 1
-                        errormsgs.append('%8d -- Czech character (0x115, tracklist: %s): https://www.discogs.com/release/%s' % (count, t['position'], str(release_id)))
-                    if 'extraartists' in t:
-                        for artist in t['extraartists']:
-                            if chr(0x115) in artist['name']:
-                                count += 1
-                                errormsgs.append('%8d -- Czech character (0x115, artist name at: %s): https://www.discogs.com/release/%s' % (count, t['position'], str(release_id)))
-                if 'artists' in release:
-                    for artist in release['artists']:
-                        if chr(0x115) in artist['name']:
-                            count += 1
-                            errormsgs.append('%8d -- Czech character (0x115, artist name: %s): https://www.discogs.com/release/%s' % (count, artist['name'], str(release_id)))
-                if 'extraartists' in release:
-                    for artist in release['extraartists']:
-                        if chr(0x115) in artist['name']:
+        if country in ['Czechoslovakia', 'Czech Republic']:
+            for t in release['tracklist']:
+                if discogssmells.czech_wrong_char in t['title']:
+                    count += 1
+                    errormsgs.append('%8d -- Czech character (0x115, tracklist: %s): https://www.discogs.com/release/%s' % (count, t['position'], str(release_id)))
+                if 'extraartists' in t:
+                    for artist in t['extraartists']:
+                        if discogssmells.czech_wrong_char in artist['name']:
                             count += 1
-                            errormsgs.append('%8d -- Czech character (0x115, artist name: %s): https://www.discogs.com/release/%s' % (count, artist['name'], str(release_id)))
-                for i in release['identifiers']:
-                    if chr(0x115) in i['value']:
+                            errormsgs.append('%8d -- Czech character (0x115, artist name at: %s): https://www.discogs.com/release/%s' % (count, t['position'], str(release_id)))
+            if 'artists' in release:
+                for artist in release['artists']:
+                    if discogssmells.czech_wrong_char in artist['name']:
                         count += 1
-                        errormsgs.append('%8d -- Czech character (0x115, BaOI): https://www.discogs.com/release/%s' % (count, str(release_id)))
-                    if 'description' in i:
-                        if chr(0x115) in i['description']:
-                            count += 1
-                            errormsgs.append('%8d -- Czech character (0x115, BaOI): https://www.discogs.com/release/%s' % (count, str(release_id)))
-                if 'notes' in release:
-                    if chr(0x115) in release['notes']:
+                        errormsgs.append('%8d -- Czech character (0x115, artist name: %s): https://www.discogs.com/release/%s' % (count, artist['name'], str(release_id)))
+            if 'extraartists' in release:
+                for artist in release['extraartists']:
+                    if discogssmells.czech_wrong_char in artist['name']:
                         count += 1
-                        errormsgs.append('%8d -- Czech character (0x115, Notes): https://www.discogs.com/release/%s' % (count, str(release_id)))
+                        errormsgs.append('%8d -- Czech character (0x115, artist name: %s): https://www.discogs.com/release/%s' % (count, artist['name'], str(release_id)))
+            for i in release['identifiers']:
+                if discogssmells.czech_wrong_char in i['value']:
+                    count += 1
+                    errormsgs.append('%8d -- Czech character (0x115, BaOI): https://www.discogs.com/release/%s' % (count, str(release_id)))
+                if 'description' in i:
+                    if discogssmells.czech_wrong_char in i['description']:
+                        count += 1
+                        errormsgs.append('%8d -- Czech character (0x115, BaOI): https://www.discogs.com/release/%s' % (count, str(release_id)))
+            if 'notes' in release:
+                if discogssmells.czech_wrong_char in release['notes']:
+                    count += 1
+                    errormsgs.append('%8d -- Czech character (0x115, Notes): https://www.discogs.com/release/%s' % (count, str(release_id)))
 
     # check credit roles in three places:
     # 1. artists
@@ -188,7 +228,7 @@ def processrelease(release, config_settings, count, credits, ibuddy, favourites)
     if 'released' in release:
         if config_settings['check_month']:
             if '-' in release['released']:
-                monthres = re.search('-(\d+)-', release['released'])
+                monthres = monthre.search(release['released'])
                 if monthres != None:
                     monthnr = int(monthres.groups()[0])
                     if monthnr == 0:
@@ -248,13 +288,11 @@ def processrelease(release, config_settings, count, credits, ibuddy, favourites)
             if config_settings['check_deposito']:
                 # now check for D.L.
                 dlfound = False
-                for d in discogssmells.depositores:
-                    result = d.search(l['catno'])
-                    if result != None:
-                        for depositovalre in discogssmells.depositovalres:
-                            if depositovalre.search(l['catno']) != None:
-                                dlfound = True
-                                break
+                catno = l['catno'].lower()
+                result = finddeposito(catno)
+                if result != None:
+                    if discogssmells.depositovalres_any.search(catno) != None:
+                        dlfound = True
 
                 if dlfound:
                     count += 1
@@ -290,9 +328,7 @@ def processrelease(release, config_settings, count, credits, ibuddy, favourites)
         if 'text' in f:
             if f['text'] != '':
                 if config_settings['check_spars_code']:
-                    tmpspars = f['text'].lower().strip()
-                    for s in ['.', ' ', '•', '·', '[', ']', '-', '|', '/']:
-                        tmpspars = tmpspars.replace(s, '')
+                    tmpspars = f['text'].lower().strip().translate(SPARS_TRANSLATE)
                     if tmpspars in discogssmells.validsparscodes:
                         count += 1
                         errormsgs.append('%8d -- Possible SPARS Code (in Format): https://www.discogs.com/release/%s' % (count, str(release_id)))
@@ -323,9 +359,7 @@ def processrelease(release, config_settings, count, credits, ibuddy, favourites)
                         count += 1
                         errormsgs.append('%8d -- Sony Format Code in SPARS: https://www.discogs.com/release/%s' % (count, str(release_id)))
                     else:
-                        tmpspars = v.lower().strip()
-                        for s in ['.', ' ', '•', '·', '[', ']', '-', '|', '/']:
-                            tmpspars = tmpspars.replace(s, '')
+                        tmpspars = v.lower().strip().translate(SPARS_TRANSLATE)
                         if not tmpspars in discogssmells.validsparscodes:
                             count += 1
                             errormsgs.append('%8d -- SPARS Code (format): https://www.discogs.com/release/%s' % (count, str(release_id)))
@@ -333,17 +367,14 @@ def processrelease(release, config_settings, count, credits, ibuddy, favourites)
                 # first check the description free text field
                 sparsfound = False
                 if 'description' in identifier:
-                    for spars in discogssmells.spars_ftf:
-                        if spars in identifier['description'].lower():
-                            sparsfound = True
+                    if discogssmells.spars_ftf_any.search(identifier['description'].lower()) != None:
+                        sparsfound = True
                 # then also check the value to see if there is a valid SPARS
                 if v.lower() in discogssmells.validsparscodes:
                     sparsfound = True
                 else:
                     if 'd' in v.lower():
-                        tmpspars = v.strip()
-                        for s in ['.', ' ', '•', '·', '[', ']', '-', '|', '/']:
-                            tmpspars = tmpspars.replace(s, '')
+                        tmpspars = v.strip().translate(SPARS_TRANSLATE)
                         if tmpspars in discogssmells.validsparscodes:
                             sparsfound = True
                 # print error if some SPARS code reference was found
@@ -379,15 +410,13 @@ def processrelease(release, config_settings, count, credits, ibuddy, favourites)
         if config_settings['check_rights_society']:
             if identifier['type'] != 'Rights Society':
                 foundrightssociety = False
-                for r in discogssmells.rights_societies:
-                    if v.replace('.', '') == r or v.replace(' ', '') == r:
-                        count += 1
-                        foundrightssociety = True
-                        if identifier['type'] == 'Barcode':
-                            errormsgs.append('%8d -- Rights Society (Barcode): https://www.discogs.com/release/%s' % (count, str(release_id)))
-                        else:
-                            errormsgs.append('%8d -- Rights Society (BaOI): https://www.discogs.com/release/%s' % (count, str(release_id)))
-                        break
+                if v.replace('.', '') in discogssmells.rights_societies or v.replace(' ', '') in discogssmells.rights_societies:
+                    count += 1
+                    foundrightssociety = True
+                    if identifier['type'] == 'Barcode':
+                        errormsgs.append('%8d -- Rights Society (Barcode): https://www.discogs.com/release/%s' % (count, str(release_id)))
+                    else:
+                        errormsgs.append('%8d -- Rights Society (BaOI): https://www.discogs.com/release/%s' % (count, str(release_id)))
                 if not foundrightssociety and 'description' in identifier:
                     if identifier['description'].lower() in discogssmells.rights_societies_ftf:
                         count += 1
@@ -424,12 +453,8 @@ def processrelease(release, config_settings, count, credits, ibuddy, favourites)
                 if isrc_tmp.startswith('CODE'):
                     isrc_tmp = isrc_tmp.split('CODE')[-1].strip()
 
-                # replace a few characters
-                isrc_tmp = isrc_tmp.replace('-', '')
-                isrc_tmp = isrc_tmp.replace(' ', '')
-                isrc_tmp = isrc_tmp.replace('.', '')
-                isrc_tmp = isrc_tmp.replace(':', '')
-                isrc_tmp = isrc_tmp.replace('–', '')
+                # remove a few characters
+                isrc_tmp = isrc_tmp.translate(ISRC_TRANSLATE)
                 if not len(isrc_tmp) == 12:
                     count += 1
                     errormsgs.append('%8d -- ISRC (wrong length): https://www.discogs.com/release/%s' % (count, str(release_id)))
@@ -441,101 +466,87 @@ def processrelease(release, config_settings, count, credits, ibuddy, favourites)
                     elif identifier['description'].lower().startswith('issrc'):
                         count += 1
                         errormsgs.append('%8d -- ISRC Code (BaOI): https://www.discogs.com/release/%s' % (count, str(release_id)))
-                    else:
-                        for isrc in discogssmells.isrc_ftf:
-                            if isrc in identifier['description'].lower():
-                                count += 1
-                                errormsgs.append('%8d -- ISRC Code (BaOI): https://www.discogs.com/release/%s' % (count, str(release_id)))
+                    elif discogssmells.isrc_ftf_any.search(identifier['description'].lower()) != None:
+                        count += 1
+                        errormsgs.append('%8d -- ISRC Code (BaOI): https://www.discogs.com/release/%s' % (count, str(release_id)))
         if identifier['type'] == 'Barcode':
             pass
 
         # check depósito legal in BaOI
         if config_settings['check_deposito']:
-            if 'country' in release:
-                if release['country'] == 'Spain':
-                    if identifier['type'] == 'Depósito Legal':
-                        founddeposito = True
-                        if v.strip().endswith('.'):
+            if country == 'Spain':
+                if identifier['type'] == 'Depósito Legal':
+                    founddeposito = True
+                    if v.strip().endswith('.'):
+                        count += 1
+                        errormsgs.append('%8d -- Depósito Legal (formatting): https://www.discogs.com/release/%s' % (count, str(release_id)))
+                    if year != None:
+                        # now try to find the year
+                        depositoyear = None
+                        if v.strip().endswith('℗'):
                             count += 1
-                            errormsgs.append('%8d -- Depósito Legal (formatting): https://www.discogs.com/release/%s' % (count, str(release_id)))
-                        if year != None:
-                            # now try to find the year
-                            depositoyear = None
-                            if v.strip().endswith('℗'):
-                                count += 1
-                                errormsgs.append('%8d -- Depósito Legal (formatting, has ℗): https://www.discogs.com/release/%s' % (count, str(release_id)))
-                                # ugly hack, remove ℗ to make at least be able to do some sort of check
-                                v = v.strip().rsplit('℗', 1)[0]
-                            # several separators, including some Unicode ones
-                            for sep in ['-', '–', '/', '.', ' ', '\'', '_']:
-                                try:
-                                    depositoyeartext = v.strip().rsplit(sep, 1)[-1]
-                                    if sep == '.' and len(depositoyeartext) == 3:
-                                        continue
-                                    if '.' in depositoyeartext:
-                                        depositoyeartext = depositoyeartext.replace('.', '')
-                                    depositoyear = int(depositoyeartext)
-                                    if depositoyear < 100:
-                                        # correct the year. This won't work correctly after 2099.
-                                        if depositoyear <= currentyear - 2000:
-                                            depositoyear += 2000
-                                        else:
-                                            depositoyear += 1900
-                                    break
-                                except:
-                                    pass
+                            errormsgs.append('%8d -- Depósito Legal (formatting, has ℗): https://www.discogs.com/release/%s' % (count, str(release_id)))
+                            # ugly hack, remove ℗ to make at least be able to do some sort of check
+                            v = v.strip().rsplit('℗', 1)[0]
+                        # several separators, including some Unicode ones
+                        for sep in ['-', '–', '/', '.', ' ', '\'', '_']:
+                            try:
+                                depositoyeartext = v.strip().rsplit(sep, 1)[-1]
+                                if sep == '.' and len(depositoyeartext) == 3:
+                                    continue
+                                if '.' in depositoyeartext:
+                                    depositoyeartext = depositoyeartext.replace('.', '')
+                                depositoyear = int(depositoyeartext)
+                                if depositoyear < 100:
+                                    # correct the year. This won't work correctly after 2099.
+                                    if depositoyear <= CURRENT_YEAR - 2000:
+                                        depositoyear += 2000
+                                    else:
+                                        depositoyear += 1900
+                                break
+                            except:
+                                pass
 
-                            # TODO, also allow (year), example: https://www.discogs.com/release/265497
-                            if depositoyear != None:
-                                if depositoyear < 1900:
-                                    count += 1
-                                    errormsgs.append("%8d -- Depósito Legal (impossible year): https://www.discogs.com/release/%s" % (count, str(release_id)))
-                                elif depositoyear > currentyear:
-                                    count += 1
-                                    errormsgs.append("%8d -- Depósito Legal (impossible year): https://www.discogs.com/release/%s" % (count, str(release_id)))
-                                elif year < depositoyear:
-                                    count += 1
-                                    errormsgs.append("%8d -- Depósito Legal (release date earlier): https://www.discogs.com/release/%s" % (count, str(release_id)))
-                            else:
+                        # TODO, also allow (year), example: https://www.discogs.com/release/265497
+                        if depositoyear != None:
+                            yearerror = checkyear(depositoyear, year)
+                            if yearerror != None:
                                 count += 1
-                                errormsgs.append("%8d -- Depósito Legal (year not found): https://www.discogs.com/release/%s" % (count, str(release_id)))
-                    elif identifier['type'] == 'Barcode':
-                        for depositovalre in discogssmells.depositovalres:
-                            if depositovalre.match(v.lower()) != None:
+                                errormsgs.append("%8d -- Depósito Legal (%s): https://www.discogs.com/release/%s" % (count, yearerror, str(release_id)))
+                        else:
+                            count += 1
+                            errormsgs.append("%8d -- Depósito Legal (year not found): https://www.discogs.com/release/%s" % (count, str(release_id)))
+                elif identifier['type'] == 'Barcode':
+                    if discogssmells.depositovalres_any.match(v.lower()) != None:
+                        founddeposito = True
+                        count += 1
+                        errormsgs.append('%8d -- Depósito Legal (in Barcode): https://www.discogs.com/release/%s' % (count, str(release_id)))
+                else:
+                    if v.startswith("Depósito"):
+                        founddeposito = True
+                        count += 1
+                        errormsgs.append('%8d -- Depósito Legal (BaOI): https://www.discogs.com/release/%s' % (count, str(release_id)))
+                    elif v.startswith("D.L."):
+                        founddeposito = True
+                        count += 1
+                        errormsgs.append('%8d -- Depósito Legal (BaOI): https://www.discogs.com/release/%s' % (count, str(release_id)))
+                    else:
+                        if 'description' in identifier:
+                            found = False
+                            result = finddeposito(identifier['description'].lower())
+                            if result != None:
+                                found = True
+
+                            # sometimes the depósito value itself can be found in the free text field
+                            if not found:
+                                deposres = discogssmells.depositovalres_any.match(identifier['description'].lower())
+                                if deposres != None:
+                                    found = True
+
+                            if found:
                                 founddeposito = True
                                 count += 1
-                                errormsgs.append('%8d -- Depósito Legal (in Barcode): https://www.discogs.com/release/%s' % (count, str(release_id)))
-                                break
-                    else:
-                        if v.startswith("Depósito"):
-                            founddeposito = True
-                            count += 1
-                            errormsgs.append('%8d -- Depósito Legal (BaOI): https://www.discogs.com/release/%s' % (count, str(release_id)))
-                        elif v.startswith("D.L."):
-                            founddeposito = True
-                            count += 1
-                            errormsgs.append('%8d -- Depósito Legal (BaOI): https://www.discogs.com/release/%s' % (count, str(release_id)))
-                        else:
-                            if 'description' in identifier:
-                                found = False
-                                for d in discogssmells.depositores:
-                                    result = d.search(identifier['description'].lower())
-                                    if result != None:
-                                        found = True
-                                        break
-
-                                # sometimes the depósito value itself can be found in the free text field
-                                if not found:
-                                    for depositovalre in discogssmells.depositovalres:
-                                        deposres = depositovalre.match(identifier['description'].lower())
-                                        if deposres != None:
-                                            found = True
-                                            break
-
-                                if found:
-                                    founddeposito = True
-                                    count += 1
-                                    errormsgs.append('%8d -- Depósito Legal (BaOI): https://www.discogs.com/release/%s' % (count, str(release_id)))
+                                errormsgs.append('%8d -- Depósito Legal (BaOI): https://www.discogs.com/release/%s' % (count, str(release_id)))
 
         # temporary hack, move to own configuration option
         mould_sid_strict = False
@@ -543,11 +554,8 @@ def processrelease(release, config_settings, count, credits, ibuddy, favourites)
             if identifier['type'] == 'Mould SID Code':
                 if v.strip() != 'none':
                     # cleanup first for not so heavy formatting booboos
-                    mould_tmp = v.strip().lower().replace(' ', '')
-                    mould_tmp = mould_tmp.replace('-', '')
-                    # some people insist on using ƒ instead of f
-                    mould_tmp = mould_tmp.replace('ƒ', 'f')
-                    res = discogssmells.mouldsidre.match(mould_tmp)
+                    mould_tmp = v.strip().lower().translate(SID_TRANSLATE)
+                    res = discogssmells.mouldsidre.fullmatch(mould_tmp)
                     if res is None:
                         count += 1
                         errormsgs.append('%8d -- Mould SID Code (value): https://www.discogs.com/release/%s' % (count, str(release_id)))
@@ -574,7 +582,7 @@ def processrelease(release, config_settings, count, credits, ibuddy, favourites)
                 if 'description' in identifier:
                     description = identifier['description'].lower()
                     # squash repeated spaces
-                    description = re.sub('\s+', ' ', description)
+                    description = squash_whitespace(description)
                     description = description.strip()
                     if description in ['source identification code', 'sid', 'sid code', 'sid-code']:
                         count += 1
@@ -587,11 +595,8 @@ def processrelease(release, config_settings, count, credits, ibuddy, favourites)
             if identifier['type'] == 'Mastering SID Code':
                 if v.strip() != 'none':
                     # cleanup first for not so heavy formatting booboos
-                    master_tmp = v.strip().lower().replace(' ', '')
-                    master_tmp = master_tmp.replace('-', '')
-                    # some people insist on using ƒ instead of f
-                    master_tmp = master_tmp.replace('ƒ', 'f')
-                    res = discogssmells.masteringsidre.match(master_tmp)
+                    master_tmp = v.strip().lower().translate(SID_TRANSLATE)
+                    res = discogssmells.masteringsidre.fullmatch(master_tmp)
                     if res is None:
                         count += 1
                         errormsgs.append('%8d -- Mastering SID Code (value): https://www.discogs.com/release/%s' % (count, str(release_id)))
@@ -610,7 +615,7 @@ def processrelease(release, config_settings, count, credits, ibuddy, favourites)
                 if 'description' in identifier:
                     description = identifier['description'].lower()
                     # squash repeated spaces
-                    description = re.sub('\s+', ' ', description)
+                    description = squash_whitespace(description)
                     description = description.strip()
                     if description in ['source identification code', 'sid', 'sid code', 'sid-code']:
                         count += 1
@@ -622,101 +627,86 @@ def processrelease(release, config_settings, count, credits, ibuddy, favourites)
                         count += 1
                         errormsgs.append('%8d -- Possible Mastering SID Code: https://www.discogs.com/release/%s' % (count, str(release_id)))
         if config_settings['check_pkd']:
-            if 'country' in release:
-                if release['country'] == 'India':
-                    if 'pkd' in v.lower() or "production date" in v.lower():
-                        if year != None:
-                            # try a few variants
-                            pkdres = re.search("\d{1,2}/((?:19|20)?\d{2})", v)
-                            if pkdres != None:
-                                pkdyear = int(pkdres.groups()[0])
-                                if pkdyear < 100:
-                                    # correct the year. This won't work correctly after 2099.
-                                    if pkdyear <= currentyear - 2000:
-                                        pkdyear += 2000
-                                    else:
-                                        pkdyear += 1900
-                                if pkdyear < 1900:
-                                    count += 1
-                                    errormsgs.append("%8d -- Indian PKD (impossible year): https://www.discogs.com/release/%s" % (count, str(release_id)))
-                                elif pkdyear > currentyear:
-                                    count += 1
-                                    errormsgs.append("%8d -- Indian PKD (impossible year): https://www.discogs.com/release/%s" % (count, str(release_id)))
-                                elif year < pkdyear:
-                                    count += 1
-                                    errormsgs.append("%8d -- Indian PKD (release date earlier): https://www.discogs.com/release/%s" % (count, str(release_id)))
-                        else:
-                            count += 1
-                            errormsgs.append('%8d -- India PKD code (no year): https://www.discogs.com/release/%s' % (count, str(release_id)))
+            if country == 'India':
+                if 'pkd' in v.lower() or "production date" in v.lower():
+                    if year != None:
+                        # try a few variants
+                        pkdres = pkdre.search(v)
+                        if pkdres != None:
+                            pkdyear = int(pkdres.groups()[0])
+                            if pkdyear < 100:
+                                # correct the year. This won't work correctly after 2099.
+                                if pkdyear <= CURRENT_YEAR - 2000:
+                                    pkdyear += 2000
+                                else:
+                                    pkdyear += 1900
+                            yearerror = checkyear(pkdyear, year)
+                            if yearerror != None:
+                                count += 1
+                                errormsgs.append("%8d -- Indian PKD (%s): https://www.discogs.com/release/%s" % (count, yearerror, str(release_id)))
                     else:
-                        # now check the description
-                        if 'description' in identifier:
-                            description = identifier['description'].lower()
-                            if 'pkd' in description or "production date" in description:
-                                if year != None:
-                                    # try a few variants
-                                    pkdres = re.search("\d{1,2}/((?:19|20)?\d{2})", attrvalue)
-                                    if pkdres != None:
-                                        pkdyear = int(pkdres.groups()[0])
-                                        if pkdyear < 100:
-                                            # correct the year. This won't work correctly after 2099.
-                                            if pkdyear <= currentyear - 2000:
-                                                pkdyear += 2000
-                                            else:
-                                                pkdyear += 1900
-                                        if pkdyear < 1900:
-                                            count += 1
-                                            errormsgs.append("%8d -- Indian PKD (impossible year): https://www.discogs.com/release/%s" % (count, str(release_id)))
-                                        elif pkdyear > currentyear:
-                                            count += 1
-                                            errormsgs.append("%8d -- Indian PKD (impossible year): https://www.discogs.com/release/%s" % (count, str(release_id)))
-                                        elif year < pkdyear:
-                                            count += 1
-                                            errormsgs.append("%8d -- Indian PKD (release date earlier): https://www.discogs.com/release/%s" % (count, str(release_id)))
-                                    else:
+                        count += 1
+                        errormsgs.append('%8d -- India PKD code (no year): https://www.discogs.com/release/%s' % (count, str(release_id)))
+                else:
+                    # now check the description
+                    if 'description' in identifier:
+                        description = identifier['description'].lower()
+                        if 'pkd' in description or "production date" in description:
+                            if year != None:
+                                # try a few variants
+                                pkdres = pkdre.search(v)
+                                if pkdres != None:
+                                    pkdyear = int(pkdres.groups()[0])
+                                    if pkdyear < 100:
+                                        # correct the year. This won't work correctly after 2099.
+                                        if pkdyear <= CURRENT_YEAR - 2000:
+                                            pkdyear += 2000
+                                        else:
+                                            pkdyear += 1900
+                                    yearerror = checkyear(pkdyear, year)
+                                    if yearerror != None:
                                         count += 1
-                                        errormsgs.append('%8d -- India PKD code (no year): https://www.discogs.com/release/%s' % (count, str(release_id)))
+                                        errormsgs.append("%8d -- Indian PKD (%s): https://www.discogs.com/release/%s" % (count, yearerror, str(release_id)))
+                                else:
+                                    count += 1
+                                    errormsgs.append('%8d -- India PKD code (no year): https://www.discogs.com/release/%s' % (count, str(release_id)))
         # check Czechoslovak manufacturing dates
         if config_settings['check_manufacturing_date_cs']:
             # config hack, needs to be in its own configuration option
             strict_cs = False
             strict_cs = True
-            if 'country' in release:
-                if release['country'] == 'Czechoslovakia':
-                    if 'description' in identifier:
-                        description = identifier['description'].lower()
-                        if 'date' in description:
-                            if year != None:
-                                manufacturing_date_res = re.search("(\d{2})\s+\d$", identifier['value'].rstrip())
-                                if manufacturing_date_res != None:
-                                    manufacturing_year = int(manufacturing_date_res.groups()[0])
-                                    if manufacturing_year < 100:
-                                        manufacturing_year += 1900
-                                        if manufacturing_year > year:
-                                            count += 1
-                                            errormsgs.append("%8d -- Czechoslovak manufacturing date (release year wrong): https://www.discogs.com/release/%s" % (count, str(release_id)))
-                                        # possibly this check makes sense, but not always
-                                        elif manufacturing_year < year and strict_cs:
-                                            count += 1
-                                            errormsgs.append("%8d -- Czechoslovak manufacturing date (release year possibly wrong): https://www.discogs.com/release/%s" % (count, str(release_id)))
+            if country == 'Czechoslovakia':
+                if 'description' in identifier:
+                    description = identifier['description'].lower()
+                    if 'date' in description:
+                        if year != None:
+                            manufacturing_date_res = manufacturingdatere.search(identifier['value'].rstrip())
+                            if manufacturing_date_res != None:
+                                manufacturing_year = int(manufacturing_date_res.groups()[0])
+                                if manufacturing_year < 100:
+                                    manufacturing_year += 1900
+                                    if manufacturing_year > year:
+                                        count += 1
+                                        errormsgs.append("%8d -- Czechoslovak manufacturing date (release year wrong): https://www.discogs.com/release/%s" % (count, str(release_id)))
+                                    # possibly this check makes sense, but not always
+                                    elif manufacturing_year < year and strict_cs:
+                                        count += 1
+                                        errormsgs.append("%8d -- Czechoslovak manufacturing date (release year possibly wrong): https://www.discogs.com/release/%s" % (count, str(release_id)))
 
     # finally check the notes for some errors
     if 'notes' in release:
         if '카지노' in release['notes']:
             # Korean casino spam that pops up every once in a while
             errormsgs.append('Spam: https://www.discogs.com/release/%s' % str(release_id))
-        if 'country' in release:
-            if release['country'] == 'Spain':
-                if config_settings['check_deposito'] and not founddeposito:
-                    # sometimes "deposito legal" can be found in the "notes" section
-                    content_lower = release['notes'].lower()
-                    for d in discogssmells.depositores:
-                        result = d.search(content_lower)
-                        if result != None:
-                            count += 1
-                            found = True
-                            errormsgs.append('%8d -- Depósito Legal (Notes): https://www.discogs.com/release/%s' % (count, str(release_id)))
-                            break
+        if country == 'Spain':
+            if config_settings['check_deposito'] and not founddeposito:
+                # sometimes "deposito legal" can be found in the "notes" section
+                content_lower = release['notes'].lower()
+                result = finddeposito(content_lower)
+                if result != None:
+                    count += 1
+                    found = True
+                    errormsgs.append('%8d -- Depósito Legal (Notes): https://www.discogs.com/release/%s' % (count, str(release_id)))
         if config_settings['check_html']:
             # see https://support.discogs.com/en/support/solutions/articles/13000014661-how-can-i-format-text-
             if '&lt;a href="http://www.discogs.com/release/' in release['notes'].lower():
@@ -1152,25 +1142,37 @@ def main(argv):
 
     newsleep = 600
 
+    # the directory (one per million releases) that was last
+    # created, so it is not created again for every release
+    current_releasedir = None
+
     # now start a big loop
     # https://www.discogs.com/developers/#page:authentication
     while True:
         for releasenr in range(startvalue, latest_release+1):
             if startvalue == latest_release:
                 break
-            targetfilename = os.path.join(storedir, "%d" % (releasenr//1000000), "%d.json" % releasenr)
-            os.makedirs(os.path.join(storedir, "%d" % (releasenr//1000000)), exist_ok=True)
+            releasedir = os.path.join(storedir, "%d" % (releasenr//1000000))
+            if releasedir != current_releasedir:
+                os.makedirs(releasedir, exist_ok=True)
+                current_releasedir = releasedir
+            targetfilename = os.path.join(releasedir, "%d.json" % releasenr)
             if config_settings['skip404']:
                 if releasenr in skip404s:
                     continue
             if config_settings['skipdownloaded']:
-                if os.path.exists(targetfilename):
-                    if os.stat(targetfilename).st_size != 0:
-                        responsejsonfile = open(targetfilename, 'r')
-                        responsejson = json.loads(responsejsonfile.read())
-                        responsejsonfile.close()
-                        count = processrelease(responsejson, config_settings, count, credits, ibuddy, favourites)
-                        continue
+                # a single stat() both checks if the file
+                # exists and if it is not empty
+                try:
+                    downloaded = os.stat(targetfilename).st_size != 0
+                except FileNotFoundError:
+                    downloaded = False
+                if downloaded:
+                    responsejsonfile = open(targetfilename, 'r')
+                    responsejson = json.loads(responsejsonfile.read())
+                    responsejsonfile.close()
+                    count = processrelease(responsejson, config_settings, count, credits, ibuddy, favourites)
+                    continue
             print("downloading: %d" % releasenr, file=sys.stderr)
             r = requests.get('https://api.discogs.com/releases/%d' % releasenr, headers=headers)
 
@@ -15,6 +15,7 @@
 import configparser
 import datetime
 import gzip
+import io
 import pathlib
 import re
 import sys
@@ -32,14 +33,14 @@ ISRC_TRANSLATE = str.maketrans({'-': None, ' ': None, '.': None,
 
 # a list of possible label code false positives. These are
 # used when checking the catalog numbers.
-LABEL_CODE_FALSE_POSITIVES = set([654, 1005, 1060, 2495, 5320, 11358, 20234, 20561, 22804, 23541,
-                                  29480, 38653, 39161, 54361, 63510, 66210, 97031, 113617, 123839,
-                                  127100, 130286, 163947, 185266, 199380, 226480, 237745, 238695,
-                                  251227, 253128, 253548, 487381, 498544, 510628, 511917, 593249,
-                                  605295, 620121, 645109, 646715, 656580, 762933, 810881, 943057,
-                                  1210375, 1446781, 1624446, 1674048])
+LABEL_CODE_FALSE_POSITIVES = frozenset([654, 1005, 1060, 2495, 5320, 11358, 20234, 20561, 22804, 23541,
+                                        29480, 38653, 39161, 54361, 63510, 66210, 97031, 113617, 123839,
+                                        127100, 130286, 163947, 185266, 199380, 226480, 237745, 238695,
+                                        251227, 253128, 253548, 487381, 498544, 510628, 511917, 593249,
+                                        605295, 620121, 645109, 646715, 656580, 762933, 810881, 943057,
+                                        1210375, 1446781, 1624446, 1674048])
 
-RIGHTS_SOCIETY_DELIMITERS = ['/', '|', '\\', '-', '—', '•', '·', ',', ':', ' ', '&', '+']
+RIGHTS_SOCIETY_DELIMITERS = ('/', '|', '\\', '-', '—', '•', '·', ',', ':', ' ', '&', '+')
 
 # a quick and dirty translation table to see if rights society values
 # are correct. This is just for the first big sweep.
@@ -47,11 +48,11 @@ RIGHTS_SOCIETY_TRANSLATE_QND = str.maketrans({'.': None, ' ': None, '•': None,
                                               '[': None, ']': None, '(': None,
                                               ')': None})
 
-SID_INVALID_FORMATS = set(['Vinyl', 'Cassette', 'Shellac', 'File',
-                           'VHS', 'DCC', 'Memory Stick', 'Edison Disc'])
+SID_INVALID_FORMATS = frozenset(['Vinyl', 'Cassette', 'Shellac', 'File',
+                                 'VHS', 'DCC', 'Memory Stick', 'Edison Disc'])
 
 # SID descriptions (either Mastering or Mould)
-SID_DESCRIPTIONS = ['source identification code', 'sid', 'sid code', 'sid-code']
+SID_DESCRIPTIONS = frozenset(['source identification code', 'sid', 'sid code', 'sid-code'])
 
 SPARS_TRANSLATE = str.maketrans({'.': None, ' ': None, '•': None, '·': None,
                                  '∙': None, '᛫': None, '[': None, ']': None,
@@ -64,13 +65,23 @@ SID_TRANSLATE = str.maketrans({' ': None, '-': None,
                               '⨍': 'f', 'ƒ': 'f',
                               'ρ': 'p', 'ƥ': 'p'})
 
-TRACKLIST_CHECK_FORMATS = ['Vinyl', 'Cassette', 'Shellac', '8-Track Cartridge']
+# size of the buffer used for reading the decompressed data dump. The
+# XML parser reads small chunks, so read bigger blocks from gzip instead.
+DUMP_BUFFER_SIZE = 1024 * 1024
+
+TRACKLIST_CHECK_FORMATS = frozenset(['Vinyl', 'Cassette', 'Shellac', '8-Track Cartridge'])
 
 # grab the current year. Make sure to set the clock of your machine
 # to the correct date or use NTP!
 CURRENT_YEAR = datetime.datetime.now(datetime.UTC).year
 
 pkd_re = re.compile(r"\d{1,2}/((?:19|20)?\d{2})")
+whitespace_re = re.compile(r'\s+')
+month_re = re.compile(r'-(\d+)-')
+manufacturing_date_re = re.compile(r"(\d{2})\s+\d$")
+isrc_re = re.compile(r"\w{5}(\d{2})\d{5}")
+cinram_re = re.compile(r'#(\d{2})')
+pallas_re = re.compile(r'P\+O[–-]\d{4,5}[–-][ABCD]\d?\s+\d{2}[–-](\d{2})')
 
 @dataclass
 class CleanupConfig:
@@ -136,6 +147,30 @@ def check_spars(value, year):
                 errors.append(f"impossible year: {year}")
     return errors
 
+def check_year_range(found_year, year):
+    '''Helper method for checking a year found in an identifier
+       against the release year'''
+    errors = []
+    if not 1900 <= found_year <= CURRENT_YEAR:
+        errors.append(f"impossible year: {found_year}")
+    elif year < found_year:
+        errors.append("release date earlier")
+    return errors
+
+def squash_whitespace(text):
+    '''Helper method for squashing repeated whitespace into a single space.
+       Any whitespace other than a single space is not printable, so the
+       regular expression is only needed in that case.'''
+    if '  ' in text or not text.isprintable():
+        return whitespace_re.sub(' ', text)
+    return text
+
+def find_deposito(text):
+    '''Helper method for searching variants of "depósito legal"'''
+    if discogssmells.depositores_literal not in text:
+        return None
+    return discogssmells.depositores_any.search(text)
+
 def check_rights_society(value):
     '''Helper method for checking rights societies'''
     errors = []
@@ -143,8 +178,9 @@ def check_rights_society(value):
     if value in discogssmells.rights_societies_wrong:
         errors.append(f"possible wrong value: {value}")
 
-    if value in discogssmells.rights_societies_wrong_char:
-        errors.append(f"wrong character set: {value}")
+    if value not in discogssmells.rights_societies and value not in discogssmells.rights_societies_native:
+        if value.translate(discogssmells.rights_societies_confusables) in discogssmells.rights_societies_confusable:
+            errors.append(f"wrong character set: {value}")
 
     return errors
 
@@ -159,7 +195,7 @@ def app():
               help='release number to scan', type=int)
 def pretty_print(datadump, requested_release):
     try:
-        with gzip.open(datadump, "rb") as dumpfile:
+        with io.BufferedReader(gzip.open(datadump, "rb"), buffer_size=DUMP_BUFFER_SIZE) as dumpfile:
             counter = 1
             prev_counter = 1
             for event, element in et.iterparse(dumpfile):
@@ -386,7 +422,7 @@ def check(cfg, datadump, requested_release):
         pass
 
     try:
-        with gzip.open(datadump, "rb") as dumpfile:
+        with io.BufferedReader(gzip.open(datadump, "rb"), buffer_size=DUMP_BUFFER_SIZE) as dumpfile:
             counter = 1
             prev_counter = 1
             last_release_checked = 0
@@ -446,30 +482,31 @@ def check(cfg, datadump, requested_release):
                                         pass
                                     break
 
+                    # the country does not change while processing the
+                    # elements, so determine once which country specific
+                    # checks apply instead of comparing for every element.
+                    check_czech_spelling = settings.czechoslovak_spelling and country in ['Czechoslovakia', 'Czech Republic']
+
                     # and process the different elements
                     for child in element:
                         if settings.report_all:
                             if release_id == last_release_checked:
                                 break
 
-                        if country in ['Czechoslovakia', 'Czech Republic']:
-                            if settings.czechoslovak_spelling:
-                                # People use 0x115 instead of 0x11B, which look very similar
-                                # but 0x115 is not valid in the Czech alphabet. Check for all
-                                # data except the YouTube playlist.
-                                # https://www.discogs.com/group/thread/757556
-                                if child.tag != 'videos':
-                                    czech_error_found = False
-                                    for iter_child in child.iter():
-                                        for i in ['description', 'value']:
-                                            free_text = iter_child.get(i, '').lower()
-                                            if chr(0x115) in free_text:
-                                                print_error(counter, 'Czech character (0x115)', release_id)
-                                                counter += 1
-                                                czech_error_found = True
-                                                break
-                                        if czech_error_found:
+                        if check_czech_spelling:
+                            # Check for all data except the YouTube playlist.
+                            if child.tag != 'videos':
+                                czech_error_found = False
+                                for iter_child in child.iter():
+                                    for i in ['description', 'value']:
+                                        free_text = iter_child.get(i, '').lower()
+                                        if discogssmells.czech_wrong_char in free_text:
+                                            print_error(counter, 'Czech character (0x115)', release_id)
+                                            counter += 1
+                                            czech_error_found = True
                                             break
+                                    if czech_error_found:
+                                        break
 
                         if child.tag in ['artists', 'extraartists']:
                             if settings.artist:
@@ -567,20 +604,18 @@ def check(cfg, datadump, requested_release):
                                                             counter += 1
                                                     '''
 
-                                                    for pl in discogssmells.plants:
-                                                        if company_nr == pl[0]:
-                                                            if year < pl[1]:
-                                                                print_error(counter, f'Pressing Plant {pl[2]} (possibly wrong year {year})', release_id)
-                                                                counter += 1
-                                                                break
+                                                    if company_nr in discogssmells.plants_by_id:
+                                                        plant_year, plant_name = discogssmells.plants_by_id[company_nr]
+                                                        if year < plant_year:
+                                                            print_error(counter, f'Pressing Plant {plant_name} (possibly wrong year {year})', release_id)
+                                                            counter += 1
 
-                                                    for pl in discogssmells.plants_compact_disc:
-                                                        if company_nr == pl[0]:
-                                                            if 'CD' in formats:
-                                                                if year < pl[1]:
-                                                                    print_error(counter, f'Pressing Plant {pl[2]} (possibly wrong year {year})', release_id)
-                                                                    counter += 1
-                                                                    break
+                                                    if company_nr in discogssmells.plants_compact_disc_by_id:
+                                                        plant_year, plant_name = discogssmells.plants_compact_disc_by_id[company_nr]
+                                                        if 'CD' in formats:
+                                                            if year < plant_year:
+                                                                print_error(counter, f'Pressing Plant {plant_name} (possibly wrong year {year})', release_id)
+                                                                counter += 1
 
                         elif child.tag == 'formats':
                             for release_format in child:
@@ -692,15 +727,17 @@ def check(cfg, datadump, requested_release):
                                         print_error(counter, 'Creative Commons reference', release_id)
                                         counter += 1
 
-                                if country == 'Czechoslovakia' and year is not None:
-                                    if settings.czechoslovak_dates:
+                                # The country specific checks below are mutually
+                                # exclusive, so at most one of them is entered.
+                                if country == 'Czechoslovakia':
+                                    if settings.czechoslovak_dates and year is not None:
                                         try:
                                             description = identifier.get('description', '').strip().lower()
                                             value = identifier.get('value', '').strip().lower()
                                         except:
                                             continue
                                         if 'date' in description:
-                                            manufacturing_date_res = re.search(r"(\d{2})\s+\d$", value)
+                                            manufacturing_date_res = manufacturing_date_re.search(value)
                                             if manufacturing_date_res is not None:
                                                 manufacturing_year = int(manufacturing_date_res.groups()[0])
                                                 if manufacturing_year < 100:
@@ -714,7 +751,7 @@ def check(cfg, datadump, requested_release):
                                                         counter += 1
 
                                 # Depósito Legal, only check for releases from Spain
-                                if country == 'Spain':
+                                elif country == 'Spain':
                                     if settings.deposito_legal:
                                         try:
                                             value = identifier.get('value').strip()
@@ -729,6 +766,7 @@ def check(cfg, datadump, requested_release):
                                             if year is not None:
                                                 # now try to find the year
                                                 deposito_year = None
+                                                year_value = value
                                                 if value.endswith('℗'):
                                                     print_error(counter, "Depósito Legal (formatting, has ℗)", release_id)
                                                     counter += 1
@@ -758,14 +796,8 @@ def check(cfg, datadump, requested_release):
 
                                                 # TODO, also allow (year), example: https://www.discogs.com/release/265497
                                                 if deposito_year is not None:
-                                                    if deposito_year < 1900:
-                                                        print_error(counter, f"Depósito Legal (impossible year: {deposito_year})", release_id)
-                                                        counter += 1
-                                                    elif deposito_year > CURRENT_YEAR:
-                                                        print_error(counter, f"Depósito Legal (impossible year: {deposito_year})", release_id)
-                                                        counter += 1
-                                                    elif year < deposito_year:
-                                                        print_error(counter, "Depósito Legal (release date earlier)", release_id)
+                                                    for err in check_year_range(deposito_year, year):
+                                                        print_error(counter, f"Depósito Legal ({err})", release_id)
                                                         counter += 1
                                                 else:
                                                     print_error(counter, "Depósito Legal (year not found)", release_id)
@@ -779,23 +811,19 @@ def check(cfg, datadump, requested_release):
                                             description_lower = description.lower()
 
                                             if not deposito_found:
-                                                for depositovalre in discogssmells.depositovalres:
-                                                    if depositovalre.match(value_lower) is not None:
-                                                        print_error(counter, f"Depósito Legal (in {identifier_type})", release_id)
-                                                        counter += 1
-                                                        deposito_found = True
-                                                        break
+                                                if discogssmells.depositovalres_any.match(value_lower) is not None:
+                                                    print_error(counter, f"Depósito Legal (in {identifier_type})", release_id)
+                                                    counter += 1
+                                                    deposito_found = True
 
                                             # check for a DL hint in the description field
                                             if description != '':
                                                 if not deposito_found:
-                                                    for d in discogssmells.depositores:
-                                                        result = d.search(description_lower)
-                                                        if result is not None:
-                                                            print_error(counter, f"Depósito Legal (in {identifier_type} (description))", release_id)
-                                                            counter += 1
-                                                            deposito_found = True
-                                                            break
+                                                    result = find_deposito(description_lower)
+                                                    if result is not None:
+                                                        print_error(counter, f"Depósito Legal (in {identifier_type} (description))", release_id)
+                                                        counter += 1
+                                                        deposito_found = True
                                                     if not deposito_found and settings.debug:
                                                         # print descriptions for debugging. Careful.
                                                         print(f'Depósito Legal debug: {release_id}, {description}')
@@ -803,16 +831,14 @@ def check(cfg, datadump, requested_release):
                                                 # sometimes the depósito value itself can be
                                                 # found in the free text field
                                                 if not deposito_found:
-                                                    for depositovalre in discogssmells.depositovalres:
-                                                        deposres = depositovalre.match(description_lower)
-                                                        if deposres is not None:
-                                                            print_error(counter, f"Depósito Legal (in {identifier_type} (description))", release_id)
-                                                            counter += 1
-                                                            deposito_found = True
-                                                            break
+                                                    deposres = discogssmells.depositovalres_any.match(description_lower)
+                                                    if deposres is not None:
+                                                        print_error(counter, f"Depósito Legal (in {identifier_type} (description))", release_id)
+                                                        counter += 1
+                                                        deposito_found = True
 
                                 # Greek license numbers
-                                if country == 'Greece':
+                                elif country == 'Greece':
                                     if settings.greek_license:
                                         try:
                                             description = identifier.get('description', '').strip().lower()
@@ -833,7 +859,7 @@ def check(cfg, datadump, requested_release):
                                                     pass
 
                                 # India PKD
-                                if country == 'India':
+                                elif country == 'India':
                                     if settings.indian_pkd:
                                         try:
                                             value = identifier.get('value', '').lower()
@@ -851,11 +877,8 @@ def check(cfg, datadump, requested_release):
                                                             pkdyear += 2000
                                                         else:
                                                             pkdyear += 1900
-                                                    if pkdyear < 1900 or pkdyear > CURRENT_YEAR:
-                                                        print_error(counter, 'Indian PKD (impossible year)', release_id)
-                                                        counter += 1
-                                                    elif year < pkdyear:
-                                                        print_error(counter, 'Indian PKD (release date earlier)', release_id)
+                                                    for err in check_year_range(pkdyear, year):
+                                                        print_error(counter, f'Indian PKD ({err})', release_id)
                                                         counter += 1
                                             else:
                                                 print_error(counter, 'India PKD code (no year)', release_id)
@@ -900,7 +923,7 @@ def check(cfg, datadump, requested_release):
                                             else:
                                                 isrcs_seen.add(isrc_tmp)
 
-                                            isrcres = re.match(r"\w{5}(\d{2})\d{5}", isrc_tmp)
+                                            isrcres = isrc_re.match(isrc_tmp)
                                             if isrcres is None:
                                                 print_error(counter, 'ISRC (wrong format)', release_id)
                                                 counter += 1
@@ -938,12 +961,9 @@ def check(cfg, datadump, requested_release):
                                             elif description_lower.startswith('issrc'):
                                                 print_error(counter, f'ISRC Code (in {identifier_type})', release_id)
                                                 counter += 1
-                                            else:
-                                                for isrc in discogssmells.isrc_ftf:
-                                                    if isrc in description_lower:
-                                                        print_error(counter, f'ISRC Code (in {identifier_type})', release_id)
-                                                        counter += 1
-                                                        break
+                                            elif discogssmells.isrc_ftf_any.search(description_lower) is not None:
+                                                print_error(counter, f'ISRC Code (in {identifier_type})', release_id)
+                                                counter += 1
                                 # Label Code
                                 if settings.label_code:
                                     try:
@@ -977,13 +997,14 @@ def check(cfg, datadump, requested_release):
                                     except:
                                         continue
                                     if identifier_type == 'Matrix / Runout':
-                                        for pdmc in discogssmells.pmdc_misspellings:
-                                            if pdmc in value:
-                                                print_error(counter, 'Matrix (PDMC instead of PMDC)', release_id)
-                                                counter += 1
+                                        if discogssmells.pmdc_misspellings_literal in value:
+                                            for pdmc in discogssmells.pmdc_misspellings:
+                                                if pdmc in value:
+                                                    print_error(counter, 'Matrix (PDMC instead of PMDC)', release_id)
+                                                    counter += 1
                                         if year is not None:
                                             if 'MFG BY CINRAM' in value and '#' in value and 'USA' not in value:
-                                                cinramres = re.search(r'#(\d{2})', value)
+                                                cinramres = cinram_re.search(value)
                                                 if cinramres is not None:
                                                     cinramyear = int(cinramres.groups()[0])
                                                     # correct the year. This won't work correctly after 2099.
@@ -999,7 +1020,7 @@ def check(cfg, datadump, requested_release):
                                                         counter += 1
                                             elif 'P+O' in value:
                                                 # https://www.discogs.com/label/277449-PO-Pallas
-                                                pallasres = re.search(r'P\+O[–-]\d{4,5}[–-][ABCD]\d?\s+\d{2}[–-](\d{2})', value)
+                                                pallasres = pallas_re.search(value)
                                                 if pallasres is not None:
                                                     pallasyear = int(pallasres.groups()[0])
                                                     # correct the year. This won't work correctly after 2099.
@@ -1022,7 +1043,7 @@ def check(cfg, datadump, requested_release):
                                         if value_lower not in discogssmells.sid_ignore:
                                             # cleanup first for not so heavy formatting booboos
                                             master_sid_tmp = value_lower.translate(SID_TRANSLATE)
-                                            res = discogssmells.masteringsidre.match(master_sid_tmp)
+                                            res = discogssmells.masteringsidre.fullmatch(master_sid_tmp)
                                             if res is None:
                                                 print_error(counter, f'Mastering SID Code (illegal value: {value})', release_id)
                                                 counter += 1
@@ -1056,7 +1077,7 @@ def check(cfg, datadump, requested_release):
                                         if value_lower not in discogssmells.sid_ignore:
                                             # cleanup first for not so heavy formatting booboos
                                             mould_sid_tmp = value_lower.translate(SID_TRANSLATE)
-                                            res = discogssmells.mouldsidre.match(mould_sid_tmp)
+                                            res = discogssmells.mouldsidre.fullmatch(mould_sid_tmp)
                                             if res is None:
                                                 print_error(counter, f'Mould SID Code (illegal value: {value})', release_id)
                                                 counter += 1
@@ -1167,7 +1188,7 @@ def check(cfg, datadump, requested_release):
 
                                             if description != '':
                                                 # squash repeated spaces
-                                                description = re.sub(r'\s+', ' ', description)
+                                                description = squash_whitespace(description)
                                                 if description in discogssmells.rights_societies_ftf:
                                                     errors = check_rights_society(value_upper)
 
@@ -1231,11 +1252,9 @@ def check(cfg, datadump, requested_release):
                                         else:
                                             description = identifier.get('description', '').lower()
                                             if description != '':
-                                                for spars in discogssmells.spars_ftf:
-                                                    if spars in description:
-                                                        print_error(counter, f'Possible SPARS Code (in {identifier_type})', release_id)
-                                                        counter += 1
-                                                        break
+                                                if discogssmells.spars_ftf_any.search(description) is not None:
+                                                    print_error(counter, f'Possible SPARS Code (in {identifier_type})', release_id)
+                                                    counter += 1
 
                                 # debug code to print all descriptions
                                 # Useful to find misspellings of various fields
@@ -1268,17 +1287,12 @@ def check(cfg, datadump, requested_release):
                                 if settings.deposito_legal and country == 'Spain':
                                     deposito_legal_found = False
                                     if label_id not in [26617, 60778]:
-                                        for d in discogssmells.depositores:
-                                            result = d.search(catno)
-                                            if result is not None:
-                                                for depositovalre in discogssmells.depositovalres:
-                                                    if depositovalre.search(catno) is not None:
-                                                        deposito_legal_found = True
-                                                        break
-                                            if deposito_legal_found:
-                                                print_error(counter, f'Possible Depósito Legal (in Catalogue Number: {catno})', release_id)
-                                                counter += 1
-                                                break
+                                        if find_deposito(catno) is not None:
+                                            if discogssmells.depositovalres_any.search(catno) is not None:
+                                                deposito_legal_found = True
+                                        if deposito_legal_found:
+                                            print_error(counter, f'Possible Depósito Legal (in Catalogue Number: {catno})', release_id)
+                                            counter += 1
 
                         elif child.tag == 'notes':
                             #if '카지노' in child.text:
@@ -1292,11 +1306,9 @@ def check(cfg, datadump, requested_release):
                                         # sometimes "deposito legal" can be found
                                         # in the "notes" section.
                                         content_lower = child.text.lower()
-                                        for d in discogssmells.depositores:
-                                            result = d.search(content_lower)
-                                            if result is not None:
-                                                deposito_found_in_notes = True
-                                                break
+                                        result = find_deposito(content_lower)
+                                        if result is not None:
+                                            deposito_found_in_notes = True
 
                                 # see https://support.discogs.com/en/support/solutions/articles/13000014661-how-can-i-format-text-
                                 if settings.url_in_html:
@@ -1320,7 +1332,7 @@ def check(cfg, datadump, requested_release):
                         elif child.tag == 'released':
                             if child.text:
                                 if settings.month_valid:
-                                    monthres = re.search(r'-(\d+)-', child.text)
+                                    monthres = month_re.search(child.text)
                                     if monthres is not None:
                                         month_nr = int(monthres.groups()[0])
                                         if month_nr == 0:
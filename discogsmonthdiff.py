@@ -10,28 +10,44 @@
 #
 # Copyright 2018-2022 - Armijn Hemel
 
+import array
+import bisect
+import mmap
+import os
+import re
+import sys
+
 import click
 
-@click.command(short_help='process Discogs files and print releases that were different')
-@click.option('--old', '-o', 'old_month', required=True, help='file with data from the old month', type=click.File('r'))
-@click.option('--new', '-n', 'new_month', required=True, help='file with data from the new month', type=click.File('r'))
-def main(old_month, new_month):
-    # store the old releases, as a list, so order is kept
-    oldreleases = []
+RELEASE_URL = 'https://www.discogs.com/release/'
 
-    for i in old_month:
-        try:
-            oldrelease = int(i.strip().split('https://www.discogs.com/release/')[-1])
-        except:
-            continue
+# regular expression to find the release ids in the output of the
+# cleanup script. Lines for Tracklisting, Role and Artist errors
+# are skipped.
+RELEASE_RE = re.compile(rb'^(?!.*(?:Tracklisting|Role|Artist)).*'
+                        + re.escape(RELEASE_URL.encode())
+                        + rb'(\d+)[ \t\r\f\v]*$', re.MULTILINE)
 
-        if 'Tracklisting' in i:
-            continue
-        if 'Role' in i:
-            continue
-        if 'Artist' in i:
-            continue
-        oldreleases.append(oldrelease)
+def read_releases(month_file):
+    '''Return the release ids from a file, in the order they appear.
+       Standard input ('-') cannot be mapped, so it is read instead.'''
+    if month_file == '-':
+        return [int(release) for release in RELEASE_RE.findall(sys.stdin.buffer.read())]
+    with open(month_file, 'rb') as releases_file:
+        if os.fstat(releases_file.fileno()).st_size == 0:
+            return []
+        with mmap.mmap(releases_file.fileno(), 0, access=mmap.ACCESS_READ) as releases_mmap:
+            return [int(release) for release in RELEASE_RE.findall(releases_mmap)]
+
+@click.command(short_help='process Discogs files and print releases that were different')
+@click.option('--old', '-o', 'old_month', required=True, help='file with data from the old month',
+              type=click.Path(exists=True, dir_okay=False, allow_dash=True))
+@click.option('--new', '-n', 'new_month', required=True, help='file with data from the new month',
+              type=click.Path(exists=True, dir_okay=False, allow_dash=True))
+def main(old_month, new_month):
+    oldreleases = read_releases(old_month)
+    if not oldreleases:
+        return
 
     # store the latest wrong release in the old release set. This is used
     # as a cut off value. It (falsely) assumes that this is the last release
@@ -39,36 +55,19 @@ def main(old_month, new_month):
     # Discogs does not include when a release was added in the XML data dump.
     latestoldrelease = oldreleases[-1]
 
-    oldreleasesset = set(oldreleases)
-
-    newreleases = []
-
-    for i in new_month:
-        try:
-            newrelease = int(i.strip().split('https://www.discogs.com/release/')[-1])
-        except:
-            continue
-
-        if newrelease > latestoldrelease:
-            break
-        if 'Tracklisting' in i:
-            continue
-        if 'Role' in i:
-            continue
-        if 'Artist' in i:
-            continue
-        if newrelease not in oldreleasesset:
-            pass
-            #print(i.strip())
-        newreleases.append(newrelease)
+    # store the old releases sorted in a compact array instead of a set
+    oldreleases = array.array('q', sorted(oldreleases))
 
     # Now check for each of the new releases if they are present
-    # in the set of old releases. If not, it is a newly introduced
+    # in the old releases. If not, it is a newly introduced
     # error and should be reported. Outputs data that can be fed
     # into makecharts.py
-    for i in newreleases:
-        if i not in oldreleasesset:
-            print(' -- https://www.discogs.com/release/%d' % i)
+    for newrelease in read_releases(new_month):
+        if newrelease > latestoldrelease:
+            break
+        index = bisect.bisect_left(oldreleases, newrelease)
+        if index == len(oldreleases) or oldreleases[index] != newrelease:
+            print(' -- %s%d' % (RELEASE_URL, newrelease))
 
 if __name__ == "__main__":
     main()
@@ -7,9 +7,9 @@
 ##
 ## Copyright 2017 - Armijn Hemel
 
+import itertools
+
+# only every fifth line contains a credit
 creditslines = open('credits2', 'r')
-counter = 0
-for i in creditslines:
-	if (counter % 5) == 0:
-		print(i.strip()[4:-5])
-	counter += 1
+for i in itertools.islice(creditslines, 0, None, 5):
+	print(i.strip()[4:-5])
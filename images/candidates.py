@@ -21,8 +21,51 @@
 import sys
 import os
 import argparse
-
-import xml.dom.minidom
+import multiprocessing
+import re
+
+# the files only need to be parsed to count the image elements,
+# which can be done on the raw data as '<' can only appear
+# escaped in XML text.
+imagere = re.compile(rb'<image[\s/>]')
+
+def find_releases(xmldir, smells):
+    '''Yield the release number and path of each XML file in the
+       directory, except for releases with known smells, as these
+       do not need to be read at all'''
+    with os.scandir(xmldir) as direntries:
+        for entry in direntries:
+            releasenr = int(entry.name.rsplit('.')[0])
+            if releasenr in smells:
+                continue
+            yield (releasenr, entry.path)
+
+def process_release(release):
+    '''Check a single XML file and return the release number and
+       the amount of images, or None if it is not a candidate'''
+    (releasenr, xmlfilename) = release
+
+    # open each file, read and check:
+    # 1. is there an images element? If not exit.
+    xmlfile = open(xmlfilename, 'rb')
+    xmldata = xmlfile.read()
+    xmlfile.close()
+    if b'<description>7"' not in xmldata:
+        return
+    #if b'<format name="Vinyl"' not in xmldata:
+        #return
+    if b'<images>' not in xmldata:
+        return
+    if b'<identifier type="Dep' in xmldata:
+        return
+    if b'sito Legal' in xmldata:
+        return
+    if b'sito legal' in xmldata:
+        return
+
+    # count the image elements
+    images = imagere.findall(xmldata)
+    return (releasenr, len(images))
 
 def main(argv):
     parser = argparse.ArgumentParser()
@@ -61,36 +104,15 @@ def main(argv):
 
     candidates = set()
 
-    releases = os.listdir(args.xmldir)
-    for r in releases:
-        # open each file, read and check:
-        # 1. is there an images element? If not exit.
-        releasenr = int(r.rsplit('.')[0])
-        if releasenr in smells:
-            continue
-        xmlfile = open(os.path.join(args.xmldir, r), 'rb')
-        xmldata = xmlfile.read()
-        xmlfile.close()
-        if b'<description>7"' not in xmldata:
-            continue
-        #if b'<format name="Vinyl"' not in xmldata:
-            #continue
-        if b'<images>' not in xmldata:
-            continue
-        if b'<identifier type="Dep' in xmldata:
-            continue
-        if b'sito Legal' in xmldata:
-            continue
-        if b'sito legal' in xmldata:
-            continue
-        xmldom = xml.dom.minidom.parseString(xmldata)
-
-        # get the images element
-        try:
-            images = xmldom.getElementsByTagName('image')
-        except:
+    # the files are independent, so process them in parallel
+    pool = multiprocessing.Pool()
+    releases = find_releases(args.xmldir, smells)
+    for res in pool.imap_unordered(process_release, releases, chunksize=256):
+        if res is None:
             continue
-        candidates.add((releasenr, len(images)))
+        candidates.add(res)
+    pool.close()
+    pool.join()
 
     candidatessorted = sorted(candidates, key=lambda x: x[1], reverse=True)
     counter = 1
@@ -17,6 +17,13 @@ rx0 = re.compile(r'(?:lc)[\s/\-]*(\d{4,6})')
 
 label_regex.append(rx0)
 
+# all label codes start with 'lc', so the regular expressions
+# only have to be tried for label components with that prefix.
+# Check this when adding new regular expressions.
+label_code_prefix = 'lc'
+assert all(rx.pattern.startswith(f'(?:{label_code_prefix})') for rx in label_regex), \
+    f"label code regular expression that does not start with '{label_code_prefix}'"
+
 label_counter = collections.Counter()
 
 total = 0
@@ -29,16 +36,19 @@ with open(label_filename, 'r') as label_file:
             continue
         total += 1
         label_component = i.strip()[10:].strip().lower()
+
+        # skip the regular expressions for anything that
+        # does not start with the label code prefix
+        if not label_component.startswith(label_code_prefix):
+            ignored += 1
+            continue
+
         label_code_found = False
         for rx in label_regex:
             res = rx.match(label_component)
             if res is not None:
-                label_code = res.groups()[0]
-                if len(label_code) == 4:
-                    label_code = "00" + label_code
-                elif len(label_code) == 5:
-                    label_code = "0" + label_code
-                label_counter.update([label_code])
+                # label codes are padded to 6 digits
+                label_counter[res.groups()[0].zfill(6)] += 1
                 label_code_found = True
                 break
         if label_code_found:
@@ -45,13 +45,19 @@ pdfmetrics.registerFont(TTFont('Times-Roman', liberationpath))
               help='Discogs input file with smells', type=click.File('r'))
 @click.option('--output-file', '-o', 'output_file', required=True, help='output file',
               type=click.Path(path_type=pathlib.Path))
-def main(input_file, output_file):
+@click.option('--compress-level', '-c', 'compress_level', default=6,
+              help='PNG compression level (0-9, lower is faster, default 6)',
+              type=click.IntRange(0, 9))
+def main(input_file, output_file, compress_level):
     if output_file.is_dir():
         print(f"outputfile {output_file} is a directory, cannot overwrite", file=sys.stderr)
         sys.exit(1)
 
     unique_releases = set()
 
+    # count the number of releases, with a smell, per million releases
+    statistics = collections.Counter()
+
     # store the number of the last release found with a small in the
     # dataset. This is to ensure that the right amount of columns will
     # be generated in the end through an ugly hack
@@ -63,32 +69,23 @@ def main(input_file, output_file):
             #release_number = int(l.rsplit('/', 1)[1])
             release_number = int(l.rsplit('/', 1)[1].split()[0])
             max_release_number = max(max_release_number, release_number)
-            unique_releases.add(release_number)
+            if release_number not in unique_releases:
+                unique_releases.add(release_number)
+                statistics[release_number//1000000] += 1
         else:
             print(l)
 
-    # count the number of releases, with a smell
-    statistics = collections.Counter()
-    statistics.update(map(lambda x: x//1000000, unique_releases))
-
     last_index = max_release_number//1000000
 
-    bardata = (sorted(statistics.items()))
+    # create a bar for every million releases, including empty
+    # bars for ranges without any smells
+    bardata = [(i, statistics[i]) for i in range(last_index + 1)]
     barwidth = 20
 
-    # sometimes some dummy data need to be inserted to
-    # ensure that empty bars are generated if needed
-    if len(bardata) != last_index:
-        for i in range(0, last_index):
-            if bardata[i][0] != i:
-                for d in range(0, bardata[i][0] - i):
-                    bardata.append((i, 0))
-                    bardata.sort()
-
     print("Unique releases:", len(unique_releases))
     print(bardata)
 
-    maximumvalue = max(map(lambda x: x[1], bardata))
+    maximumvalue = max(x[1] for x in bardata)
     step = int(math.log(maximumvalue, 10))
     valueStep = pow(10, step)
 
@@ -107,7 +104,7 @@ def main(input_file, output_file):
     barchart.y = 20
     barchart.height = 200
     barchart.width = chartwidth
-    barchart.data = [tuple(map(lambda x: x[1], bardata))]
+    barchart.data = [tuple(x[1] for x in bardata)]
     barchart.strokeColor = colors.white
     barchart.valueAxis.valueMin = 0
     barchart.valueAxis.labels.fontSize = 16
@@ -118,11 +115,14 @@ def main(input_file, output_file):
     barchart.categoryAxis.labels.dy = -10
     #barchart.categoryAxis.labels.angle = -90
     barchart.categoryAxis.labels.fontSize = 16
-    barchart.categoryAxis.categoryNames = list(map(lambda x: str(x[0]), bardata))
+    barchart.categoryAxis.categoryNames = [str(x[0]) for x in bardata]
     barchart.barWidth = barwidth
 
     drawing.add(barchart)
-    renderPM.drawToFile(drawing, output_file, fmt='PNG')
+
+    # render to an image first so the PNG compression level can be set
+    image = renderPM.drawToPIL(drawing)
+    image.save(output_file, 'PNG', compress_level=compress_level)
 
 if __name__ == "__main__":
     main()
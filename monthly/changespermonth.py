@@ -10,45 +10,73 @@
 
 import argparse
 import collections
+import functools
 import multiprocessing
 import os
 import sys
 
-import defusedxml.minidom
+# The files that are compared are split from the Discogs dumps by
+# process-discogs-chunks.py and are trusted, so the stdlib parser
+# is used: defusedxml sets up a new parser for every file, which
+# is about twice as slow for these small files.
+import xml.etree.ElementTree as et
+
 import tlsh
 
+def equal_elements(first, second):
+    '''Compare two elements and everything below them. Attributes are
+       compared in order, as they would be in the serialized XML.'''
+    if first.tag != second.tag or first.text != second.text or first.tail != second.tail:
+        return False
+    if list(first.attrib.items()) != list(second.attrib.items()):
+        return False
+    if len(first) != len(second):
+        return False
+    return all(map(equal_elements, first, second))
+
+def release_numbers(xmldir):
+    '''Return the numbers of all releases with an XML file in a directory'''
+    releases = set()
+    with os.scandir(xmldir) as direntries:
+        for entry in direntries:
+            (release_id, extension) = os.path.splitext(entry.name)
+            if extension == '.xml' and release_id.isdigit():
+                releases.add(int(release_id))
+    return releases
+
 def process_release(firstdir, seconddir, releasenr):
     firstfile = os.path.join(firstdir, f"{releasenr}.xml")
-    if not os.path.exists(firstfile):
-        return
     secondfile = os.path.join(seconddir, f"{releasenr}.xml")
-    if not os.path.exists(secondfile):
-        return
     firstdata = open(firstfile, 'rb').read()
 
-    firstxmldom = defusedxml.minidom.parseString(firstdata)
+    firstroot = et.fromstring(firstdata)
     seconddata = open(secondfile, 'rb').read()
-    secondxmldom = defusedxml.minidom.parseString(seconddata)
+    secondroot = et.fromstring(seconddata)
 
-    firstrelease = firstxmldom.getElementsByTagName('release')[0]
-    secondrelease = secondxmldom.getElementsByTagName('release')[0]
-    firstchilds = firstrelease.childNodes
-    secondchilds = secondrelease.childNodes
+    firstrelease = next(firstroot.iter('release'))
+    secondrelease = next(secondroot.iter('release'))
+    firstchilds = list(firstrelease)
+    secondchilds = list(secondrelease)
 
     # store all differences found
     differences = []
 
+    # store the children of the second release by name. If there are
+    # multiple children with the same name, the first one is used.
+    secondchildsbyname = {}
+    for s in secondchilds:
+        if s.tag == 'videos':
+            continue
+        if s.tag not in secondchildsbyname:
+            secondchildsbyname[s.tag] = s
+
     # check if any nodes were added or removed
     firstchildnames = set()
-    secondchildnames = set()
     for ch in firstchilds:
-        if ch.nodeName == 'videos':
-            continue
-        firstchildnames.add(ch.nodeName)
-    for ch in secondchilds:
-        if ch.nodeName == 'videos':
+        if ch.tag == 'videos':
             continue
-        secondchildnames.add(ch.nodeName)
+        firstchildnames.add(ch.tag)
+    secondchildnames = set(secondchildsbyname)
     for n in firstchildnames - secondchildnames:
         differences.append(('removed', n))
     for n in secondchildnames - firstchildnames:
@@ -57,33 +85,35 @@ def process_release(firstdir, seconddir, releasenr):
     # store the total TLSH score
     total_tlsh = 0
 
-    # see if any nodes were changed by pretty printing
-    # to XML first and then comparing the XML *shudder*
+    # see if any nodes were changed. Only nodes that are
+    # different are serialized to XML, as input for TLSH.
     for ch in firstchilds:
-        if ch.nodeName == 'videos':
+        if ch.tag == 'videos':
+            continue
+        s = secondchildsbyname.get(ch.tag)
+        if s is None:
             continue
-        for s in secondchilds:
-            if ch.nodeName != s.nodeName:
+        # the text following an element is not part of it
+        ch.tail = None
+        s.tail = None
+        if not equal_elements(ch, s):
+            differences.append(('changed', ch.tag))
+            chxml = et.tostring(ch, encoding='unicode')
+            sxml = et.tostring(s, encoding='unicode')
+            firsttlsh = tlsh.Tlsh()
+            firsttlsh.update(chxml.encode())
+            try:
+                firsttlsh.final()
+            except:
                 continue
-            chxml = ch.toxml()
-            sxml = s.toxml()
-            if chxml != sxml:
-                differences.append(('changed', ch.nodeName))
-                firsttlsh = tlsh.Tlsh()
-                firsttlsh.update(chxml.encode())
-                try:
-                    firsttlsh.final()
-                except:
-                    break
-                secondtlsh = tlsh.Tlsh()
-                secondtlsh.update(sxml.encode())
-                try:
-                    secondtlsh.final()
-                except:
-                    break
-                distance = secondtlsh.diff(firsttlsh)
-                total_tlsh += distance
-            break
+            secondtlsh = tlsh.Tlsh()
+            secondtlsh.update(sxml.encode())
+            try:
+                secondtlsh.final()
+            except:
+                continue
+            distance = secondtlsh.diff(firsttlsh)
+            total_tlsh += distance
     return (differences, total_tlsh, releasenr)
 
 def main():
@@ -121,23 +151,24 @@ def main():
 
     release_to_sha1 = {}
 
+    # the files with checksums are plain ASCII and the checksums
+    # are only compared, so read them as bytes without decoding
     try:
-        shafile1 = open(args.first, 'r')
+        shafile1 = open(args.first, 'rb')
     except:
         print(f"Could not open {args.first}, exiting", file=sys.stderr)
         sys.exit(1)
 
     for i in shafile1:
-        (release_id, sha) = i.split('\t')
-        release = int(release_id.split('.')[0])
-        release_to_sha1[release] = sha.strip()
+        (release_id, sha) = i.split(b'\t')
+        release_to_sha1[int(release_id.partition(b'.')[0])] = sha.strip()
 
     shafile1.close()
 
     sha2_releases = set()
 
     try:
-        shafile2 = open(args.second, 'r')
+        shafile2 = open(args.second, 'rb')
     except:
         print(f"Could not open {args.second}, exiting", file=sys.stderr)
         sys.exit(1)
@@ -147,14 +178,15 @@ def main():
     # keep track of releases that are different and exist in
     # the first data set: new releases are ignored.
     for i in shafile2:
-        (release_id, sha) = i.split('\t')
-        release = int(release_id.split('.')[0])
-        if release in release_to_sha1:
-            sha2_release = sha.strip()
-            if release_to_sha1[release] != sha2_release:
-                sha2_releases.add(release)
-            else:
-                samecontent += 1
+        (release_id, sha) = i.split(b'\t')
+        release = int(release_id.partition(b'.')[0])
+        sha1_release = release_to_sha1.get(release)
+        if sha1_release is None:
+            continue
+        if sha1_release != sha.strip():
+            sha2_releases.add(release)
+        else:
+            samecontent += 1
 
     shafile2.close()
 
@@ -165,19 +197,21 @@ def main():
     tlshcounter = collections.Counter()
     differencecounter = collections.Counter()
 
-    # for each file see if the nodes are equal. Because Python's
-    # DOM implementation doesn't implement DOM Level 3 this
-    # is a bit of a hack. If DOM Level 3 were supported this
-    # could be done by isEqualNode.
+    # for each file see if the nodes are equal. The results are
+    # processed as they come in, in order. Only the release numbers
+    # are sent to the workers, in chunks.
     pool = multiprocessing.Pool()
-    res = pool.starmap(process_release, map(lambda x: (args.dir, args.seconddir, x), sha2_releases))
-    for r in res:
-        if r is None:
-            continue
+    process = functools.partial(process_release, args.dir, args.seconddir)
+
+    # only process releases that have a file in both directories.
+    # Listing the directories once is a lot cheaper than checking
+    # for every single file.
+    releases_in_both = release_numbers(args.dir) & release_numbers(args.seconddir)
+    for r in pool.imap(process, sha2_releases & releases_in_both, chunksize=64):
         (differences, total_tlsh, releasenr) = r
         if differences != []:
             differencecounter.update(differences)
-            tlshcounter.update([total_tlsh])
+            tlshcounter[total_tlsh] += 1
         else:
             no_differences.add(releasenr)
 
@@ -48,8 +48,7 @@ def main():
 
     for i in shafile1:
         (release_id, sha) = i.split('\t')
-        release = release_id.split('.')[0]
-        release_to_sha1[release] = sha.strip()
+        release_to_sha1[release_id.partition('.')[0]] = sha.strip()
 
     shafile1.close()
 
@@ -63,26 +62,28 @@ def main():
 
     for i in shafile2:
         (release_id, sha) = i.split('\t')
-        release = release_id.split('.')[0]
-        release_to_sha2[release] = sha.strip()
+        release_to_sha2[release_id.partition('.')[0]] = sha.strip()
 
     shafile2.close()
 
-    shakeys1 = set(release_to_sha1.keys())
-    shakeys2 = set(release_to_sha2.keys())
+    # dictionary views support set operations, so
+    # there is no need to copy the keys into sets
+    shakeys1 = release_to_sha1.keys()
+    shakeys2 = release_to_sha2.keys()
 
     if not args.printchanged:
         print("MONTH 1: %d" % len(shakeys1), "MONTH 2: %d" % len(shakeys2))
 
-        print("%d releases in sha1 that are not in sha2" % len(shakeys1.difference(shakeys2)))
-        print("%d releases in sha2 that are not in sha1" % len(shakeys2.difference(shakeys1)))
+        print("%d releases in sha1 that are not in sha2" % len(shakeys1 - shakeys2))
+        print("%d releases in sha2 that are not in sha1" % len(shakeys2 - shakeys1))
 
     samecontent = 0
     differentcontent = 0
 
-    for i in release_to_sha2:
-        if i in release_to_sha1:
-            if release_to_sha1[i] == release_to_sha2[i]:
+    for (i, sha2) in release_to_sha2.items():
+        sha1 = release_to_sha1.get(i)
+        if sha1 is not None:
+            if sha1 == sha2:
                 samecontent += 1
             else:
                 differentcontent += 1
@@ -55,8 +55,7 @@ def main():
 
     for i in shafile1:
         (release_id, sha) = i.split('\t')
-        release = release_id.split('.')[0]
-        all_releases.add(release)
+        all_releases.add(release_id.partition('.')[0])
 
     release_to_status1 = {}
 
@@ -64,8 +63,7 @@ def main():
 
     for i in notacceptedfile1:
         (release_id, status) = i.split('\t')
-        release = release_id.split('.')[0]
-        release_to_status1[release] = i[1].strip()
+        release_to_status1[release_id.partition('.')[0]] = status.strip()
 
     notacceptedfile1.close()
 
@@ -75,18 +73,21 @@ def main():
 
     for i in notacceptedfile2:
         (release_id, status) = i.split('\t')
-        release = release_id.split('.')[0]
-        release_to_status2[release] = i[1].strip()
+        release_to_status2[release_id.partition('.')[0]] = status.strip()
 
     notacceptedfile2.close()
 
-    notkeys1 = set(release_to_status1.keys())
-    notkeys2 = set(release_to_status2.keys())
+    # dictionary views support set operations, so
+    # there is no need to copy the keys into sets
+    notkeys1 = release_to_status1.keys()
+    notkeys2 = release_to_status2.keys()
 
-    print("%d releases in not1 that are not in not2" % len(notkeys1.difference(notkeys2)))
-    print("%d releases in not2 that are not in not1" % len(notkeys2.difference(notkeys1)))
+    only_in_not1 = notkeys1 - notkeys2
 
-    for i in sorted(notkeys1.difference(notkeys2)):
+    print("%d releases in not1 that are not in not2" % len(only_in_not1))
+    print("%d releases in not2 that are not in not1" % len(notkeys2 - notkeys1))
+
+    for i in sorted(only_in_not1):
         print(i, i in all_releases)
 
 if __name__ == "__main__":
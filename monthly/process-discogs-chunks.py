@@ -15,112 +15,126 @@
 # Copyright 2017 - Armijn Hemel
 
 import argparse
+import functools
 import hashlib
 import multiprocessing
 import os
 import shutil
 import sys
-import xml.dom.minidom
+import xml.parsers.expat
+
+
+class StopParsing(Exception):
+    '''Raised to stop parsing once all information was found'''
+    pass
+
+
+def parse_release(xmldata, rename_only):
+    '''Extract the attributes of the first release element and the first
+       text of the first country element from an XML snippet. Parsing
+       stops as soon as everything that is needed was found.'''
+    release_attrs = None
+    country = []
+    in_country = False
+    seen_country = False
+
+    def start_element(name, attrs):
+        nonlocal release_attrs, in_country, seen_country
+        if in_country:
+            # only the first text node in the country element is used
+            in_country = False
+        if name == 'release' and release_attrs is None:
+            release_attrs = attrs
+            if rename_only or seen_country:
+                raise StopParsing
+        elif name == 'country' and not seen_country:
+            seen_country = True
+            in_country = True
+
+    def end_element(name):
+        nonlocal in_country
+        if in_country:
+            in_country = False
+            if release_attrs is not None:
+                raise StopParsing
+
+    def character_data(data):
+        if in_country:
+            country.append(data)
+
+    parser = xml.parsers.expat.ParserCreate()
+    parser.StartElementHandler = start_element
+    parser.EndElementHandler = end_element
+    parser.CharacterDataHandler = character_data
+    try:
+        parser.Parse(xmldata, True)
+    except StopParsing:
+        pass
+    return (release_attrs, ''.join(country))
 
 
 # process each XML chunk:
 # * compute the SHA256 of the chunk
-# * extract some information from the XML DOM
-def processxml(scanqueue, reportqueue, chunkdir, rename_only):
-    while True:
-        filename = scanqueue.get()
-        xmlfile = open(os.path.join(chunkdir, filename), 'rb')
-        xmldata = xmlfile.read()
-        xmlfile.close()
-        h = hashlib.new('sha256')
-        h.update(xmldata)
-        filehash = h.hexdigest()
-
-        # create a DOM for the XML snippet
-        xmldom = xml.dom.minidom.parseString(xmldata)
-
-        # get the top level element
-        try:
-            release_elem = xmldom.getElementsByTagName('release')[0]
-        except:
-            # No need to process the top level out-00.xml file that is
-            # generated to help xml_merge
-            # put a dummy value into the report queue
-            if not rename_only:
-                reportqueue.put({})
-            scanqueue.task_done()
-            continue
-
-        # get the release id
-        release_id = release_elem.getAttribute('id')
-
-        if not rename_only:
-            # get the status
-            release_status = release_elem.getAttribute('status')
-
-            # place holder
-            country = ""
-
-            # get the country
-            try:
-                country_elem = xmldom.getElementsByTagName('country')[0]
-                country = country_elem.childNodes[0].data
-            except:
-                # no country defined
-                pass
-
-            # get the format
-            # TODO
-
-            result = {}
-            result['filename'] = "%s.xml" % release_id
-            result['filehash'] = filehash
-            result['release_status'] = release_status
-            result['country'] = country
-            reportqueue.put(result)
-
-        try:
-            shutil.move(os.path.join(chunkdir, filename), os.path.join(chunkdir, "%s.xml" % release_id))
-        except:
-            pass
-
-        scanqueue.task_done()
-
-
-def writeresults(reportqueue, filterconfig, totallen):
-    '''Write results extracted from entries to separate files'''
+# * extract some information from the XML
+# * rename the chunk to the release id
+def processxml(chunkdir, rename_only, filename):
+    xmlfile = open(os.path.join(chunkdir, filename), 'rb')
+    xmldata = xmlfile.read()
+    xmlfile.close()
+    filehash = hashlib.sha256(xmldata).hexdigest()
+
+    # only parse the XML snippet up to the information
+    # that is needed, instead of creating a DOM
+    (release_attrs, country) = parse_release(xmldata, rename_only)
+
+    # get the top level element
+    if release_attrs is None:
+        # No need to process the top level out-00.xml file that is
+        # generated to help xml_merge
+        return None
+
+    # get the release id
+    release_id = release_attrs.get('id', '')
+
+    result = None
+    if not rename_only:
+        # get the status
+        release_status = release_attrs.get('status', '')
+
+        # get the format
+        # TODO
+
+        result = {}
+        result['filename'] = "%s.xml" % release_id
+        result['filehash'] = filehash
+        result['release_status'] = release_status
+        result['country'] = country
+
+    try:
+        shutil.move(os.path.join(chunkdir, filename), os.path.join(chunkdir, "%s.xml" % release_id))
+    except:
+        pass
+
+    return result
+
+
+def writeresult(result, filterconfig):
+    '''Write results extracted from an entry to separate files'''
     sha256file = filterconfig['sha256file']
 
     # files to write data about status to for releases that are not 'Accepted'
     notacceptedfile = filterconfig['notaccepted_file']
     # file to write country specific data to
     countryfile = filterconfig['country_file']
-    counter = 0
-    while True:
-        result = reportqueue.get()
-        if result == {}:
-            # dummy value from non-valid entries,
-            # so just update the counter and continue
-            counter += 1
-            reportqueue.task_done()
-            continue
-        filename = result['filename']
-        filehash = result['filehash']
-        country = result['country']
-        release_status = result['release_status']
-        sha256file.write("%s\t%s\n" % (filename, filehash))
-        if release_status != 'Accepted':
-            notacceptedfile.write("%s\t%s\n" % (filename, release_status))
-        countryfile.write("%s\t%s\n" % (filename, country))
-        counter += 1
 
-        # flush the files after the last result has been processed to
-        # prevent results getting lost.
-        if counter == totallen:
-            sha256file.flush()
-            countryfile.flush()
-            notacceptedfile.flush()
-        reportqueue.task_done()
+    filename = result['filename']
+    filehash = result['filehash']
+    country = result['country']
+    release_status = result['release_status']
+    sha256file.write("%s\t%s\n" % (filename, filehash))
+    if release_status != 'Accepted':
+        notacceptedfile.write("%s\t%s\n" % (filename, release_status))
+    countryfile.write("%s\t%s\n" % (filename, country))
 
 
 def main():
@@ -155,26 +169,7 @@ def main():
 
     xml_files = os.listdir(chunkdir)
 
-    totallen = len(xml_files)
-
-    # amount of processes to process entries, hardcode
-    # to # CPUs -1 for now, as one process will be needed for
-    # writing the results
-    if args.rename_only:
-        amount_of_processes = multiprocessing.cpu_count() - 1
-    else:
-        amount_of_processes = multiprocessing.cpu_count() - 1
-
-    scanmanager = multiprocessing.Manager()
-
-    scanqueue = scanmanager.Queue(maxsize=0)
-    reportqueue = scanmanager.Queue(maxsize=0)
     filterconfig = {}
-    processpool = []
-
-    for i in range(0, amount_of_processes):
-        p = multiprocessing.Process(target=processxml, args=(scanqueue, reportqueue, chunkdir, args.rename_only))
-        processpool.append(p)
 
     if not args.rename_only:
         # open a few files
@@ -187,26 +182,27 @@ def main():
         notacceptedfile = open(os.path.join(outdir, 'notaccepted-%s' % month), 'w')
         filterconfig['notaccepted_file'] = notacceptedfile
 
-        r = multiprocessing.Process(target=writeresults, args=(reportqueue, filterconfig, totallen))
-        processpool.append(r)
+    # process the chunks in a pool of workers. The file names are
+    # sent to the workers in batches and the results are written
+    # in the main process as they come in.
+    pool = multiprocessing.Pool()
+    process = functools.partial(processxml, chunkdir, args.rename_only)
 
-    for p in processpool:
-        p.start()
-
-    queue_counter = 0
-    for i in xml_files:
-        queue_counter += 1
-        scanqueue.put(i)
-        if queue_counter % 100000 == 0:
-            print("Sent to queue: %d" % queue_counter)
+    counter = 0
+    for result in pool.imap_unordered(process, xml_files, chunksize=512):
+        counter += 1
+        if counter % 100000 == 0:
+            print("Processed: %d" % counter)
             sys.stdout.flush()
-    print("Sent to queue: %d" % queue_counter)
+        if result is not None:
+            writeresult(result, filterconfig)
+    print("Processed: %d" % counter)
     sys.stdout.flush()
 
-    scanqueue.join()
-    if not args.rename_only:
-        reportqueue.join()
+    pool.close()
+    pool.join()
 
+    if not args.rename_only:
         # final flushes for the files, then close them
         sha256file.flush()
         sha256file.close()
@@ -217,9 +213,5 @@ def main():
         notacceptedfile.flush()
         notacceptedfile.close()
 
-    # finally terminate all the processes
-    for p in processpool:
-        p.terminate()
-
 if __name__ == "__main__":
     main()
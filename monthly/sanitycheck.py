@@ -36,8 +36,7 @@ def main():
     for i in countriesfile:
         try:
             (release_id, country) = i.split('\t')
-            release = release_id.split('.')[0]
-            release_to_country[release] = i[1].strip()
+            release_to_country[release_id.partition('.')[0]] = country.strip()
         except:
             continue
 
@@ -48,8 +47,7 @@ def main():
     releases_file = open(args.shafile, 'r')
     for i in releases_file:
         try:
-            release_id = i.split('.', 1)[0]
-            releases_set.add(release_id)
+            releases_set.add(i.partition('.')[0])
         except:
             continue
 
@@ -57,7 +55,9 @@ def main():
 
     print(len(releases_set) - len(release_to_country))
 
-    print(releases_set.difference(set(release_to_country.keys())))
+    # difference() accepts the dict itself, there is
+    # no need to copy its keys into a set first
+    print(releases_set.difference(release_to_country))
 
 if __name__ == "__main__":
     main()